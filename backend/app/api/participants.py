@@ -7,7 +7,11 @@ from sqlalchemy.orm import Session
 from typing import List
 
 from app.db.database import get_db
-from app.schemas.schemas import ParticipantResponse, UpdateParticipantRequest
+from app.schemas.schemas import (
+    BulkParticipantRequest,
+    ParticipantResponse,
+    UpdateParticipantRequest,
+)
 from app.services import session_service
 
 router = APIRouter(prefix="/sessions/{session_id}/participants", tags=["Participants"])
@@ -31,6 +35,28 @@ def get_participants(session_id: str, db: Session = Depends(get_db)):
     }
 
 
+@router.post("/batch", response_model=dict)
+def bulk_update_participants(
+    session_id: str,
+    request: BulkParticipantRequest,
+    db: Session = Depends(get_db),
+):
+    """Apply several participant changes in one transaction"""
+    session = session_service.get_session(db, session_id)
+    if not session:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"success": False, "error": "Session not found"},
+        )
+
+    participants = session_service.bulk_update_participants(
+        db, session_id, request.upserts, request.removals, request.presence
+    )
+    return {
+        "participants": [ParticipantResponse.model_validate(p) for p in participants]
+    }
+
+
 @router.delete("/{participant_id}", status_code=status.HTTP_204_NO_CONTENT)
 def remove_participant(
     session_id: str, participant_id: str, db: Session = Depends(get_db)
@@ -56,6 +82,8 @@ def update_participant(
 ):
     """Update participant information"""
     update_data = updates.model_dump(exclude_unset=True)
+    if update_data.get("role"):
+        update_data["role"] = update_data["role"].value
 
     participant = session_service.update_participant(
         db, session_id, participant_id, **update_data
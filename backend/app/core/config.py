@@ -29,6 +29,16 @@ class Settings(BaseSettings):
     # Session
     SESSION_EXPIRATION_HOURS: int = 24
 
+    # Participant change events (coalescing window for REST-driven changes)
+    PARTICIPANT_EVENT_COALESCE_MS: int = 10
+
+    # WebSocket protocol limits
+    WS_MAX_MESSAGE_BYTES: int = 512 * 1024
+    WS_RATE_LIMIT_PER_SECOND: float = 30.0
+    WS_RATE_LIMIT_BURST: int = 60
+    WS_CURSOR_COALESCE_MS: int = 50
+    WS_PERSIST_DELAY_MS: int = 2000
+
     # API
     API_V1_PREFIX: str = "/api/v1"
     PROJECT_NAME: str = "CodeInterview API"
@@ -37,6 +47,14 @@ class Settings(BaseSettings):
     # Environment
     ENVIRONMENT: str = "development"
 
+    # Response compression (encodings in order of preference: zstd, br, gzip)
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_ENCODINGS: list[str] = ["zstd", "br", "gzip"]
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_ZSTD_LEVEL: int = 3
+
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -7,9 +7,17 @@ from fastapi.middleware.cors import CORSMiddleware
 import time
 
 from app.core.config import get_settings
+from app.core.compression import CompressionMiddleware
 from app.db.database import Base, engine
 from app.api import sessions, participants
 from app.services.websocket_manager import manager
+from app.services.message_router import (
+    CLOSE_MESSAGE_TOO_BIG,
+    ClientSession,
+    MessageTooLarge,
+    message_router,
+)
+from app.services.room_state import room_store
 from app.schemas.schemas import HealthResponse
 
 settings = get_settings()
@@ -30,6 +38,20 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Response compression for session payloads (carry whole source files)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        encodings=settings.COMPRESSION_ENCODINGS,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        levels={
+            "gzip": settings.COMPRESSION_GZIP_LEVEL,
+            "br": settings.COMPRESSION_BROTLI_QUALITY,
+            "zstd": settings.COMPRESSION_ZSTD_LEVEL,
+        },
+        exclude_paths=(f"{settings.API_V1_PREFIX}/health",),
+    )
+
 # Include routers
 app.include_router(sessions.router, prefix=settings.API_V1_PREFIX)
 app.include_router(participants.router, prefix=settings.API_V1_PREFIX)
@@ -45,15 +67,26 @@ def health_check():
 async def websocket_endpoint(websocket: WebSocket, session_id: str):
     """WebSocket endpoint for real-time collaboration"""
     await manager.connect(websocket, session_id)
+    client = ClientSession(websocket, session_id)
     try:
         while True:
-            # Receive message from client
-            data = await websocket.receive_json()
-
-            # Broadcast to all connections in this session
-            await manager.broadcast(session_id, data)
+            # Receive raw frame; validation happens before anything is relayed
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+
+            await message_router.dispatch(
+                client, message.get("text") or message.get("bytes")
+            )
+    except MessageTooLarge:
+        await websocket.close(code=CLOSE_MESSAGE_TOO_BIG)
     except WebSocketDisconnect:
+        pass
+    finally:
         manager.disconnect(websocket, session_id)
+        # Persist live edits as soon as the last participant leaves
+        if session_id not in manager.active_connections:
+            await room_store.flush(session_id)
 
 
 @app.on_event("startup")
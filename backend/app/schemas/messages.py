@@ -0,0 +1,113 @@
+"""
+Typed WebSocket message protocol
+"""
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from typing import Annotated, Literal, Optional, Union
+
+from app.schemas.schemas import LanguageEnum, RoleEnum
+
+
+class MessageData(BaseModel):
+    """Base for message payloads; unknown fields are dropped, not relayed"""
+
+    model_config = ConfigDict(extra="ignore")
+
+
+class CodeChangeData(MessageData):
+    """Full document replacement from one participant"""
+
+    code: str
+    userId: Optional[str] = Field(None, max_length=64)
+
+
+class LanguageChangeData(MessageData):
+    """Language switch from one participant"""
+
+    language: LanguageEnum
+    userId: Optional[str] = Field(None, max_length=64)
+
+
+class CursorPosition(MessageData):
+    """Editor cursor location"""
+
+    lineNumber: int = Field(..., ge=0)
+    column: int = Field(..., ge=0)
+
+
+class CursorPositionData(MessageData):
+    """Cursor movement from one participant"""
+
+    position: CursorPosition
+    userId: str = Field(..., max_length=64)
+
+
+class PresenceUser(MessageData):
+    """User announced in a join event"""
+
+    id: str = Field(..., max_length=64)
+    name: str = Field(..., min_length=1, max_length=255)
+    role: Optional[RoleEnum] = None
+    color: Optional[str] = Field(None, max_length=50)
+
+
+class UserJoinData(MessageData):
+    """Participant announcing itself to the room"""
+
+    user: PresenceUser
+
+
+class UserLeaveData(MessageData):
+    """Participant leaving the room"""
+
+    userId: str = Field(..., max_length=64)
+
+
+class CodeChangeMessage(BaseModel):
+    """Frame carrying a document edit"""
+
+    type: Literal["code_change"]
+    data: CodeChangeData
+
+
+class LanguageChangeMessage(BaseModel):
+    """Frame carrying a language switch"""
+
+    type: Literal["language_change"]
+    data: LanguageChangeData
+
+
+class CursorPositionMessage(BaseModel):
+    """Frame carrying a cursor movement"""
+
+    type: Literal["cursor_position"]
+    data: CursorPositionData
+
+
+class UserJoinMessage(BaseModel):
+    """Frame announcing a participant"""
+
+    type: Literal["user_join"]
+    data: UserJoinData
+
+
+class UserLeaveMessage(BaseModel):
+    """Frame announcing a departure"""
+
+    type: Literal["user_leave"]
+    data: UserLeaveData
+
+
+ClientMessage = Annotated[
+    Union[
+        CodeChangeMessage,
+        LanguageChangeMessage,
+        CursorPositionMessage,
+        UserJoinMessage,
+        UserLeaveMessage,
+    ],
+    Field(discriminator="type"),
+]
+
+# Built once at import; validate_json parses and validates in a single pass
+client_message_adapter: TypeAdapter[ClientMessage] = TypeAdapter(ClientMessage)
@@ -108,6 +108,30 @@ class UpdateParticipantRequest(BaseModel):
     """Schema for updating participant"""
 
     is_online: Optional[bool] = None
+    role: Optional[RoleEnum] = None
+
+
+class ParticipantUpsert(UserInfo):
+    """Participant to add or update in a bulk operation"""
+
+    role: Optional[RoleEnum] = Field(
+        None, description="Defaults to candidate for new participants"
+    )
+
+
+class ParticipantPresence(BaseModel):
+    """Online status change for a participant"""
+
+    id: str
+    is_online: bool
+
+
+class BulkParticipantRequest(BaseModel):
+    """Batch of participant changes applied in one transaction"""
+
+    upserts: List[ParticipantUpsert] = Field(default_factory=list, max_length=500)
+    removals: List[str] = Field(default_factory=list, max_length=500)
+    presence: List[ParticipantPresence] = Field(default_factory=list, max_length=500)
 
 
 class ErrorResponse(BaseModel):
@@ -0,0 +1,151 @@
+"""
+Validation and typed routing of client WebSocket messages
+"""
+
+import asyncio
+from typing import Dict, Optional
+
+from fastapi import WebSocket, status
+from pydantic import ValidationError
+
+from app.core.config import get_settings
+from app.schemas.messages import ClientMessage, client_message_adapter
+from app.services.rate_limit import TokenBucket
+from app.services.room_state import RoomStateStore, room_store
+from app.services.websocket_manager import ConnectionManager, manager
+
+settings = get_settings()
+
+
+class MessageTooLarge(Exception):
+    """Raised when a frame exceeds the per-message size cap"""
+
+
+class ClientSession:
+    """Per-connection protocol state"""
+
+    __slots__ = ("websocket", "session_id", "bucket", "rate_limited")
+
+    def __init__(self, websocket: WebSocket, session_id: str):
+        self.websocket = websocket
+        self.session_id = session_id
+        self.bucket = TokenBucket(
+            settings.WS_RATE_LIMIT_PER_SECOND, settings.WS_RATE_LIMIT_BURST
+        )
+        self.rate_limited = False
+
+
+class MessageRouter:
+    """Validates client frames and routes each type to its handler
+
+    Frames are checked for size and rate before parsing, parsed and validated
+    in one pass, and only re-serialized, schema-conformant messages reach the
+    fan-out path:
+
+    - ``code_change`` / ``language_change``: persisted (deferred) and relayed
+    - ``cursor_position``: coalesced per user within a short window
+    - ``user_join`` / ``user_leave``: relayed
+    """
+
+    def __init__(
+        self,
+        connection_manager: ConnectionManager,
+        store: RoomStateStore,
+        max_message_bytes: int,
+        cursor_coalesce_ms: int,
+    ):
+        self.manager = connection_manager
+        self.store = store
+        self.max_message_bytes = max_message_bytes
+        self.cursor_coalesce_seconds = cursor_coalesce_ms / 1000
+        self._pending_cursors: Dict[str, Dict[str, dict]] = {}
+        self._handlers = {
+            "code_change": self.handle_code_change,
+            "language_change": self.handle_language_change,
+            "cursor_position": self.handle_cursor_position,
+            "user_join": self.relay,
+            "user_leave": self.relay,
+        }
+
+    async def dispatch(self, client: ClientSession, raw) -> None:
+        """Validate one raw frame from a client and route it"""
+        if raw is None:
+            await self.send_error(client, "INVALID_MESSAGE", "Empty frame")
+            return
+        if len(raw) > self.max_message_bytes:
+            raise MessageTooLarge()
+
+        if not client.bucket.consume():
+            # Tell the client once per throttled stretch, then drop silently
+            if not client.rate_limited:
+                client.rate_limited = True
+                await self.send_error(
+                    client,
+                    "RATE_LIMITED",
+                    "Too many messages",
+                    retry_after_ms=client.bucket.retry_after_ms(),
+                )
+            return
+        client.rate_limited = False
+
+        try:
+            message = client_message_adapter.validate_json(raw)
+        except ValidationError as e:
+            await self.send_error(
+                client, "INVALID_MESSAGE", e.errors(include_url=False)[0]["msg"]
+            )
+            return
+
+        await self._handlers[message.type](client, message)
+
+    async def send_error(
+        self, client: ClientSession, code: str, error: str, **extra
+    ) -> None:
+        """Report a protocol error to the sender only"""
+        await client.websocket.send_json(
+            {"type": "error", "data": {"code": code, "error": error, **extra}}
+        )
+
+    async def relay(self, client: ClientSession, message: ClientMessage) -> None:
+        """Forward a validated message to the room"""
+        await self.manager.broadcast(
+            client.session_id, message.model_dump(mode="json", exclude_none=True)
+        )
+
+    async def handle_code_change(self, client: ClientSession, message) -> None:
+        self.store.update(client.session_id, code=message.data.code)
+        await self.relay(client, message)
+
+    async def handle_language_change(self, client: ClientSession, message) -> None:
+        self.store.update(client.session_id, language=message.data.language.value)
+        await self.relay(client, message)
+
+    async def handle_cursor_position(self, client: ClientSession, message) -> None:
+        """Keep only the latest cursor per user until the window closes"""
+        room = self._pending_cursors.get(client.session_id)
+        if room is None:
+            room = self._pending_cursors[client.session_id] = {}
+            loop = asyncio.get_running_loop()
+            loop.call_later(
+                self.cursor_coalesce_seconds,
+                lambda: loop.create_task(self.flush_cursors(client.session_id)),
+            )
+        room[message.data.userId] = message.model_dump(mode="json", exclude_none=True)
+
+    async def flush_cursors(self, session_id: str) -> None:
+        """Relay the latest cursor of each user in a room"""
+        room: Optional[Dict[str, dict]] = self._pending_cursors.pop(session_id, None)
+        for cursor in (room or {}).values():
+            await self.manager.broadcast(session_id, cursor)
+
+
+# Close code for frames over the size cap (RFC 6455 "message too big")
+CLOSE_MESSAGE_TOO_BIG = status.WS_1009_MESSAGE_TOO_BIG
+
+# Global message router instance
+message_router = MessageRouter(
+    manager,
+    room_store,
+    max_message_bytes=settings.WS_MAX_MESSAGE_BYTES,
+    cursor_coalesce_ms=settings.WS_CURSOR_COALESCE_MS,
+)
@@ -0,0 +1,103 @@
+"""
+Publishes participant changes to WebSocket rooms after each commit
+"""
+
+import asyncio
+import threading
+from typing import Dict, Optional
+
+from app.core.config import get_settings
+from app.services.websocket_manager import ConnectionManager, manager
+
+settings = get_settings()
+
+JOIN = "join"
+LEAVE = "leave"
+UPDATE = "update"
+ROLE = "role"
+ONLINE = "online"
+
+
+def _merge(previous: Optional[dict], change: dict) -> Optional[dict]:
+    """Fold a new change into the pending one for the same participant"""
+    if previous is None:
+        return change
+    if change["action"] == LEAVE:
+        # Joined and left within one tick: the room never needs to know
+        return None if previous["action"] == JOIN else change
+    if previous["action"] in (JOIN, LEAVE):
+        return {**change, "action": JOIN}
+    if previous["action"] != change["action"]:
+        return {**change, "action": UPDATE}
+    return change
+
+
+class ParticipantEventPublisher:
+    """Coalesces participant changes per room and broadcasts them once per tick
+
+    Service functions run in the threadpool, so ``publish`` is thread-safe and
+    hands the flush over to the loop that owns the room's sockets. Rooms with
+    no connected sockets are skipped entirely.
+    """
+
+    def __init__(self, connection_manager: ConnectionManager, coalesce_ms: int = 0):
+        self.manager = connection_manager
+        self.coalesce_seconds = coalesce_ms / 1000
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Dict[str, Optional[dict]]] = {}
+
+    def publish(
+        self,
+        session_id: str,
+        action: str,
+        participant_id: str,
+        participant: Optional[dict] = None,
+    ):
+        """Queue a participant change for the room"""
+        loop = self.manager.loop
+        if loop is None or session_id not in self.manager.active_connections:
+            return
+
+        change = {"action": action, "participant": participant or {"id": participant_id}}
+        with self._lock:
+            room = self._pending.get(session_id)
+            schedule = room is None
+            if schedule:
+                room = self._pending[session_id] = {}
+            room[participant_id] = _merge(room.get(participant_id), change)
+
+        if schedule:
+            try:
+                loop.call_soon_threadsafe(self._schedule_flush, session_id)
+            except RuntimeError:
+                # Loop already closed; nobody is listening anymore
+                with self._lock:
+                    self._pending.pop(session_id, None)
+
+    def _schedule_flush(self, session_id: str):
+        """Run on the loop: flush after the coalescing window"""
+        loop = asyncio.get_running_loop()
+        if self.coalesce_seconds:
+            loop.call_later(
+                self.coalesce_seconds,
+                lambda: loop.create_task(self.flush(session_id)),
+            )
+        else:
+            loop.create_task(self.flush(session_id))
+
+    async def flush(self, session_id: str):
+        """Broadcast all pending changes for a room as one event"""
+        with self._lock:
+            room = self._pending.pop(session_id, None)
+        changes = [change for change in (room or {}).values() if change is not None]
+        if not changes:
+            return
+        await self.manager.broadcast(
+            session_id, {"type": "participants_changed", "data": {"changes": changes}}
+        )
+
+
+# Global publisher instance
+participant_events = ParticipantEventPublisher(
+    manager, coalesce_ms=settings.PARTICIPANT_EVENT_COALESCE_MS
+)
@@ -0,0 +1,32 @@
+"""
+Token-bucket rate limiting
+"""
+
+import time
+
+
+class TokenBucket:
+    """Classic token bucket: refills at ``rate`` tokens/s up to ``burst``"""
+
+    __slots__ = ("rate", "burst", "tokens", "updated_at")
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated_at = time.monotonic()
+
+    def consume(self, amount: float = 1.0) -> bool:
+        """Take tokens if available; return False when the caller is over budget"""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        if self.tokens >= amount:
+            self.tokens -= amount
+            return True
+        return False
+
+    def retry_after_ms(self, amount: float = 1.0) -> int:
+        """Milliseconds until ``amount`` tokens will be available"""
+        missing = max(0.0, amount - self.tokens)
+        return int(missing / self.rate * 1000) if self.rate else 0
@@ -0,0 +1,84 @@
+"""
+In-memory live state per session with deferred persistence
+"""
+
+import asyncio
+import logging
+from typing import Dict, Optional
+
+from app.core.config import get_settings
+from app.db import database
+from app.services import session_service
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+class RoomState:
+    """Latest document state for a session not yet written to the DB"""
+
+    __slots__ = ("session_id", "pending", "flush_handle")
+
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+        self.pending: Dict[str, str] = {}
+        self.flush_handle: Optional[asyncio.TimerHandle] = None
+
+
+class RoomStateStore:
+    """Coalesces live edits and writes them back at most once per delay
+
+    A flush is scheduled on the first change after the last write, so a busy
+    room is persisted every ``persist_delay_ms`` instead of on every keystroke.
+    """
+
+    def __init__(self, persist_delay_ms: int):
+        self.persist_delay_seconds = persist_delay_ms / 1000
+        self.rooms: Dict[str, RoomState] = {}
+        # Overridable for tests and scripts
+        self.session_factory = None
+
+    def update(self, session_id: str, **fields: str):
+        """Record new field values for a session and schedule a write"""
+        room = self.rooms.get(session_id)
+        if room is None:
+            room = self.rooms[session_id] = RoomState(session_id)
+        room.pending.update(fields)
+
+        if room.flush_handle is None:
+            loop = asyncio.get_running_loop()
+            room.flush_handle = loop.call_later(
+                self.persist_delay_seconds,
+                lambda: loop.create_task(self.flush(session_id)),
+            )
+
+    async def flush(self, session_id: str):
+        """Write pending fields for a session to the DB"""
+        room = self.rooms.pop(session_id, None)
+        if room is None:
+            return
+        if room.flush_handle is not None:
+            room.flush_handle.cancel()
+        if not room.pending:
+            return
+
+        try:
+            await asyncio.to_thread(self._write, session_id, room.pending)
+        except Exception:
+            logger.exception("Failed to persist live state for session %s", session_id)
+
+    async def flush_all(self):
+        """Write every room with pending changes"""
+        await asyncio.gather(*(self.flush(session_id) for session_id in list(self.rooms)))
+
+    def _write(self, session_id: str, fields: Dict[str, str]):
+        factory = self.session_factory or database.SessionLocal
+        db = factory()
+        try:
+            session_service.update_session(db, session_id, **fields)
+        finally:
+            db.close()
+
+
+# Global room state store
+room_store = RoomStateStore(persist_delay_ms=settings.WS_PERSIST_DELAY_MS)
@@ -4,16 +4,36 @@ Business logic for session management
 
 import secrets
 import time
+from sqlalchemy import case, delete, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import List, Optional
 from app.models.models import Session as SessionModel, Participant as ParticipantModel
-from app.schemas.schemas import SessionCreate, UserInfo, RoleEnum
+from app.schemas.schemas import (
+    SessionCreate,
+    UserInfo,
+    RoleEnum,
+    ParticipantUpsert,
+    ParticipantPresence,
+    ParticipantResponse,
+)
 from app.core.config import get_settings
+from app.services import participant_events as events
 
 settings = get_settings()
 SESSION_EXPIRATION_MS = settings.SESSION_EXPIRATION_HOURS * 60 * 60 * 1000
 
 
+def _publish_participant(session_id: str, action: str, participant) -> None:
+    """Notify the room about a committed participant change"""
+    events.participant_events.publish(
+        session_id,
+        action,
+        participant.id,
+        ParticipantResponse.model_validate(participant).model_dump(mode="json"),
+    )
+
+
 def generate_session_id() -> str:
     """Generate 8-character hex session ID"""
     return secrets.token_hex(4)
@@ -109,12 +129,14 @@ def add_participant(
         .first()
     )
 
+    action = events.UPDATE
     if participant:
         # Update existing participant
         participant.name = user.name
         participant.color = user.color
         participant.is_online = True
     else:
+        action = events.JOIN
         # Create new participant
         participant = ParticipantModel(
             id=user.id,
@@ -129,6 +151,7 @@ def add_participant(
 
     db.commit()
     db.refresh(participant)
+    _publish_participant(session_id, action, participant)
 
     return participant
 
@@ -149,6 +172,7 @@ def remove_participant(db: Session, session_id: str, participant_id: str) -> boo
 
     db.delete(participant)
     db.commit()
+    events.participant_events.publish(session_id, events.LEAVE, participant_id)
     return True
 
 
@@ -168,13 +192,23 @@ def update_participant(
     if not participant:
         return None
 
+    changed = set()
     for key, value in kwargs.items():
         if value is not None and hasattr(participant, key):
             setattr(participant, key, value)
+            changed.add(key)
 
     db.commit()
     db.refresh(participant)
 
+    if changed == {"is_online"}:
+        action = events.ONLINE
+    elif changed == {"role"}:
+        action = events.ROLE
+    else:
+        action = events.UPDATE
+    _publish_participant(session_id, action, participant)
+
     return participant
 
 
@@ -185,3 +219,107 @@ def get_participants(db: Session, session_id: str) -> list[ParticipantModel]:
         .filter(ParticipantModel.session_id == session_id)
         .all()
     )
+
+
+def _dialect_insert(db: Session):
+    """Return the INSERT construct supporting ON CONFLICT for the bound dialect"""
+    if db.get_bind().dialect.name == "sqlite":
+        return sqlite.insert
+    return postgresql.insert
+
+
+def bulk_update_participants(
+    db: Session,
+    session_id: str,
+    upserts: List[ParticipantUpsert],
+    removals: List[str],
+    presence: List[ParticipantPresence],
+) -> list[ParticipantModel]:
+    """Apply removals, upserts and presence changes in a single transaction
+
+    Each kind of change is one set-based statement; the transaction is
+    committed once and the resulting participant list is returned.
+    """
+    columns = ParticipantModel.__table__.c
+    changes = []
+
+    if removals:
+        removed = db.execute(
+            delete(ParticipantModel)
+            .where(
+                ParticipantModel.session_id == session_id,
+                ParticipantModel.id.in_(removals),
+            )
+            .returning(columns.id)
+        ).all()
+        changes.extend((events.LEAVE, row.id, None) for row in removed)
+
+    if upserts:
+        now = int(time.time() * 1000)
+        insert = _dialect_insert(db)
+        # Rows with an explicit role overwrite it; the rest keep their role
+        for with_role in (True, False):
+            batch = [u for u in upserts if (u.role is not None) == with_role]
+            if not batch:
+                continue
+            stmt = insert(ParticipantModel).values(
+                [
+                    {
+                        "id": u.id,
+                        "session_id": session_id,
+                        "name": u.name,
+                        "role": (u.role or RoleEnum.candidate).value,
+                        "color": u.color,
+                        "joined_at": now,
+                        "is_online": True,
+                    }
+                    for u in batch
+                ]
+            )
+            updates = {
+                "name": stmt.excluded.name,
+                "color": stmt.excluded.color,
+                "is_online": True,
+            }
+            if with_role:
+                updates["role"] = stmt.excluded.role
+            rows = db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[ParticipantModel.id],
+                    set_=updates,
+                    where=ParticipantModel.session_id == stmt.excluded.session_id,
+                ).returning(*columns)
+            ).all()
+            # Updated rows keep their original joined_at
+            changes.extend(
+                (events.JOIN if row.joined_at == now else events.UPDATE, row.id, row)
+                for row in rows
+            )
+
+    if presence:
+        rows = db.execute(
+            update(ParticipantModel)
+            .where(
+                ParticipantModel.session_id == session_id,
+                ParticipantModel.id.in_([p.id for p in presence]),
+            )
+            .values(
+                is_online=case(
+                    {p.id: p.is_online for p in presence},
+                    value=ParticipantModel.id,
+                )
+            )
+            .returning(*columns)
+            .execution_options(synchronize_session=False)
+        ).all()
+        changes.extend((events.ONLINE, row.id, row) for row in rows)
+
+    db.commit()
+
+    for action, participant_id, row in changes:
+        if row is None:
+            events.participant_events.publish(session_id, action, participant_id)
+        else:
+            _publish_participant(session_id, action, row)
+
+    return get_participants(db, session_id)
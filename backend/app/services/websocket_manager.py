@@ -2,8 +2,9 @@
 WebSocket connection manager for real-time collaboration
 """
 
+import asyncio
 from fastapi import WebSocket
-from typing import Dict, List
+from typing import Dict, List, Optional
 import json
 import time
 
@@ -13,10 +14,13 @@ class ConnectionManager:
 
     def __init__(self):
         self.active_connections: Dict[str, List[WebSocket]] = {}
+        # Loop serving the sockets, used to hand off events from worker threads
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
 
     async def connect(self, websocket: WebSocket, session_id: str):
         """Accept and store WebSocket connection"""
         await websocket.accept()
+        self.loop = asyncio.get_running_loop()
         if session_id not in self.active_connections:
             self.active_connections[session_id] = []
         self.active_connections[session_id].append(websocket)
@@ -0,0 +1,97 @@
+"""
+Compression tradeoff benchmark for SessionResponse payloads
+
+Run from the backend directory:
+
+    uv run python -m benchmarks.bench_compression
+"""
+
+import argparse
+import statistics
+import time
+
+from app.core.compression import available_encoders
+from app.schemas.schemas import ParticipantResponse, SessionData, SessionResponse
+
+CODE_SIZES = [512, 4 * 1024, 32 * 1024, 256 * 1024]
+PARTICIPANT_COUNTS = [2, 8]
+LEVELS = {"gzip": [1, 6, 9], "br": [1, 4, 8], "zstd": [1, 3, 9]}
+
+SAMPLE_LINES = [
+    "def two_sum(nums, target):",
+    "    seen = {}",
+    "    for index, value in enumerate(nums):",
+    "        if target - value in seen:",
+    "            return [seen[target - value], index]",
+    "        seen[value] = index",
+    "    return []",
+    "",
+    "print(two_sum([2, 7, 11, 15], 9))  # expected [0, 1]",
+]
+
+
+def build_payload(code_size: int, participant_count: int) -> bytes:
+    """Serialize a SessionData response with realistic code and participants"""
+    lines = []
+    while sum(len(line) + 1 for line in lines) < code_size:
+        lines.append(SAMPLE_LINES[len(lines) % len(SAMPLE_LINES)])
+    participants = [
+        ParticipantResponse(
+            id=f"550e8400-e29b-41d4-a716-{i:012d}",
+            name=f"Participant {i}",
+            role="interviewer" if i == 0 else "candidate",
+            color=f"hsl({i * 40 % 360}, 70%, 50%)",
+            joined_at=1733350000000 + i,
+            is_online=True,
+        )
+        for i in range(participant_count)
+    ]
+    session = SessionResponse(
+        id="a1b2c3d4",
+        created_at=1733350000000,
+        updated_at=1733350000000,
+        expires_at=1733436400000,
+        code="\n".join(lines)[:code_size],
+        language="python",
+        participants=participants,
+        creator_id=participants[0].id,
+    )
+    return SessionData(success=True, data=session).model_dump_json().encode()
+
+
+def time_encoder(factory, level: int, payload: bytes, repeat: int) -> tuple[int, float]:
+    """Return compressed size and median compression time in microseconds"""
+    timings = []
+    size = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        encoder = factory(level)
+        body = encoder.compress(payload) + encoder.finish()
+        timings.append((time.perf_counter() - start) * 1_000_000)
+        size = len(body)
+    return size, statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    encoders = available_encoders()
+    print(f"{'code':>8} {'people':>6} {'codec':>6} {'lvl':>3} "
+          f"{'bytes':>8} {'ratio':>6} {'µs':>9}")
+    for code_size in CODE_SIZES:
+        for participant_count in PARTICIPANT_COUNTS:
+            payload = build_payload(code_size, participant_count)
+            print(f"{code_size:>8} {participant_count:>6} {'none':>6} {'-':>3} "
+                  f"{len(payload):>8} {1.0:>6.2f} {0.0:>9.1f}")
+            for name, factory in encoders.items():
+                for level in LEVELS[name]:
+                    size, micros = time_encoder(factory, level, payload, args.repeat)
+                    print(f"{code_size:>8} {participant_count:>6} {name:>6} "
+                          f"{level:>3} {size:>8} {len(payload) / size:>6.2f} "
+                          f"{micros:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
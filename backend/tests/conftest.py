@@ -8,6 +8,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from app.main import app
 from app.db.database import Base, get_db
+from app.services.room_state import room_store
 
 # Use in-memory SQLite for testing
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
@@ -41,8 +42,10 @@ def client(db):
             pass
 
     app.dependency_overrides[get_db] = override_get_db
+    room_store.session_factory = TestingSessionLocal
     yield TestClient(app)
     app.dependency_overrides.clear()
+    room_store.session_factory = None
 
 
 @pytest.fixture
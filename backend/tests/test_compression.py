@@ -0,0 +1,82 @@
+"""
+Tests for response compression middleware
+"""
+
+import pytest
+from fastapi import status
+
+from app.core.compression import available_encoders, negotiate_encoding
+
+
+def _large_session_data(sample_session_data):
+    """Session payload well above the compression threshold"""
+    code = "\n".join(f"console.log('line {i}');" for i in range(400))
+    return {**sample_session_data, "code": code}
+
+
+def test_negotiate_encoding_prefers_server_order():
+    """Server preference wins among accepted codings"""
+    assert negotiate_encoding("gzip, br", ["br", "gzip"]) == "br"
+    assert negotiate_encoding("gzip;q=0, br", ["gzip"]) is None
+    assert negotiate_encoding("*", ["gzip"]) == "gzip"
+    assert negotiate_encoding("", ["gzip"]) is None
+
+
+def test_large_session_response_is_gzipped(client, sample_session_data):
+    """Session payloads above the threshold are compressed"""
+    create_response = client.post(
+        "/api/v1/sessions", json=_large_session_data(sample_session_data)
+    )
+    session_id = create_response.json()["data"]["id"]
+
+    response = client.get(
+        f"/api/v1/sessions/{session_id}", headers={"Accept-Encoding": "gzip"}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert int(response.headers["content-length"]) < len(response.content)
+    assert response.json()["data"]["id"] == session_id
+
+
+@pytest.mark.parametrize("encoding", ["br", "zstd"])
+def test_optional_encodings(client, sample_session_data, encoding):
+    """Brotli and zstd are used when installed and accepted"""
+    if encoding not in available_encoders():
+        pytest.skip(f"{encoding} codec not installed")
+
+    create_response = client.post(
+        "/api/v1/sessions", json=_large_session_data(sample_session_data)
+    )
+    session_id = create_response.json()["data"]["id"]
+
+    response = client.get(
+        f"/api/v1/sessions/{session_id}", headers={"Accept-Encoding": encoding}
+    )
+
+    assert response.headers["content-encoding"] == encoding
+    assert response.json()["data"]["id"] == session_id
+
+
+def test_small_responses_not_compressed(client):
+    """Health checks and other tiny responses skip compression"""
+    response = client.get("/api/v1/health", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "content-encoding" not in response.headers
+
+
+def test_identity_when_not_accepted(client, sample_session_data):
+    """Clients that do not advertise an encoding get plain JSON"""
+    create_response = client.post(
+        "/api/v1/sessions", json=_large_session_data(sample_session_data)
+    )
+    session_id = create_response.json()["data"]["id"]
+
+    response = client.get(
+        f"/api/v1/sessions/{session_id}", headers={"Accept-Encoding": "identity"}
+    )
+
+    assert "content-encoding" not in response.headers
+    assert response.json()["data"]["id"] == session_id
@@ -0,0 +1,60 @@
+"""
+Tests for participant change coalescing
+"""
+
+import asyncio
+
+import pytest
+
+from app.services.participant_events import ParticipantEventPublisher
+
+
+class FakeWebSocket:
+    """Minimal WebSocket stand-in that records sent messages"""
+
+    def __init__(self):
+        self.sent = []
+
+    async def accept(self):
+        pass
+
+    async def send_json(self, data):
+        self.sent.append(data)
+
+
+@pytest.fixture
+def publisher():
+    from app.services.websocket_manager import ConnectionManager
+
+    return ParticipantEventPublisher(ConnectionManager(), coalesce_ms=5)
+
+
+@pytest.mark.asyncio
+async def test_changes_in_one_tick_are_coalesced(publisher):
+    """Several changes to one participant collapse into a single event"""
+    websocket = FakeWebSocket()
+    await publisher.manager.connect(websocket, "room1")
+
+    publisher.publish("room1", "join", "u1", {"id": "u1", "is_online": True})
+    publisher.publish("room1", "online", "u1", {"id": "u1", "is_online": False})
+    publisher.publish("room1", "join", "u2", {"id": "u2"})
+    publisher.publish("room1", "leave", "u2")
+    await asyncio.sleep(0.05)
+
+    assert len(websocket.sent) == 1
+    assert websocket.sent[0]["data"]["changes"] == [
+        {"action": "join", "participant": {"id": "u1", "is_online": False}}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_rooms_without_sockets_are_skipped(publisher):
+    """Publishing to a room nobody is connected to does nothing"""
+    websocket = FakeWebSocket()
+    await publisher.manager.connect(websocket, "room1")
+
+    publisher.publish("room2", "join", "u1")
+    await asyncio.sleep(0.05)
+
+    assert websocket.sent == []
+    assert publisher._pending == {}
@@ -102,3 +102,139 @@ def test_cascade_delete_participants(client, sample_session_data):
     # Verify participants endpoint returns 404
     response = client.get(f"/api/v1/sessions/{session_id}/participants")
     assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_bulk_update_participants(client, sample_session_data):
+    """Test applying upserts, removals and presence changes in one batch"""
+    # Create session
+    create_response = client.post("/api/v1/sessions", json=sample_session_data)
+    session_id = create_response.json()["data"]["id"]
+    creator_id = sample_session_data["creator"]["id"]
+
+    # Add a participant that the batch will remove
+    leaving_user = {
+        "id": "770e8400-e29b-41d4-a716-446655440002",
+        "name": "Leaving User",
+        "color": "hsl(10, 70%, 50%)",
+    }
+    client.post(f"/api/v1/sessions/{session_id}/join", json={"user": leaving_user})
+
+    batch = {
+        "upserts": [
+            {
+                "id": "660e8400-e29b-41d4-a716-446655440001",
+                "name": "Jane Smith",
+                "color": "hsl(120, 70%, 50%)",
+            },
+            {
+                "id": "880e8400-e29b-41d4-a716-446655440003",
+                "name": "Second Interviewer",
+                "color": "hsl(200, 70%, 50%)",
+                "role": "interviewer",
+            },
+        ],
+        "removals": [leaving_user["id"]],
+        "presence": [{"id": creator_id, "is_online": False}],
+    }
+    response = client.post(
+        f"/api/v1/sessions/{session_id}/participants/batch", json=batch
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    participants = {p["id"]: p for p in response.json()["participants"]}
+    assert set(participants) == {
+        creator_id,
+        "660e8400-e29b-41d4-a716-446655440001",
+        "880e8400-e29b-41d4-a716-446655440003",
+    }
+    assert participants[creator_id]["is_online"] is False
+    assert participants[creator_id]["role"] == "interviewer"
+    assert participants["660e8400-e29b-41d4-a716-446655440001"]["role"] == "candidate"
+    assert (
+        participants["880e8400-e29b-41d4-a716-446655440003"]["role"] == "interviewer"
+    )
+
+
+def test_bulk_upsert_keeps_existing_role(client, sample_session_data):
+    """Test that upserting without a role does not demote an interviewer"""
+    create_response = client.post("/api/v1/sessions", json=sample_session_data)
+    session_id = create_response.json()["data"]["id"]
+
+    batch = {"upserts": [{**sample_session_data["creator"], "name": "Renamed"}]}
+    response = client.post(
+        f"/api/v1/sessions/{session_id}/participants/batch", json=batch
+    )
+
+    participants = response.json()["participants"]
+    assert len(participants) == 1
+    assert participants[0]["name"] == "Renamed"
+    assert participants[0]["role"] == "interviewer"
+
+
+def test_bulk_update_nonexistent_session(client):
+    """Test batch operations on a missing session"""
+    response = client.post(
+        "/api/v1/sessions/nonexist/participants/batch", json={"removals": ["x"]}
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_bulk_update_broadcasts_one_event(client, sample_session_data):
+    """Test that connected clients receive one consolidated change event"""
+    create_response = client.post("/api/v1/sessions", json=sample_session_data)
+    session_id = create_response.json()["data"]["id"]
+    creator_id = sample_session_data["creator"]["id"]
+
+    with client.websocket_connect(f"/ws/sessions/{session_id}") as websocket:
+        batch = {
+            "upserts": [
+                {
+                    "id": "660e8400-e29b-41d4-a716-446655440001",
+                    "name": "Jane Smith",
+                    "color": "hsl(120, 70%, 50%)",
+                }
+            ],
+            "presence": [{"id": creator_id, "is_online": False}],
+        }
+        client.post(f"/api/v1/sessions/{session_id}/participants/batch", json=batch)
+
+        data = websocket.receive_json()
+        assert data["type"] == "participants_changed"
+        changes = {c["participant"]["id"]: c for c in data["data"]["changes"]}
+        assert changes["660e8400-e29b-41d4-a716-446655440001"]["action"] == "join"
+        assert changes[creator_id]["action"] == "online"
+        assert changes[creator_id]["participant"]["is_online"] is False
+
+
+def test_rest_changes_notify_room(client, sample_session_data):
+    """Test that join, update and removal over REST are pushed to the room"""
+    create_response = client.post("/api/v1/sessions", json=sample_session_data)
+    session_id = create_response.json()["data"]["id"]
+    user = {
+        "id": "660e8400-e29b-41d4-a716-446655440001",
+        "name": "Jane Smith",
+        "color": "hsl(120, 70%, 50%)",
+    }
+
+    with client.websocket_connect(f"/ws/sessions/{session_id}") as websocket:
+        client.post(f"/api/v1/sessions/{session_id}/join", json={"user": user})
+        data = websocket.receive_json()
+        assert data["data"]["changes"] == [
+            {"action": "join", "participant": data["data"]["changes"][0]["participant"]}
+        ]
+        assert data["data"]["changes"][0]["participant"]["name"] == "Jane Smith"
+
+        client.patch(
+            f"/api/v1/sessions/{session_id}/participants/{user['id']}",
+            json={"role": "interviewer"},
+        )
+        data = websocket.receive_json()
+        change = data["data"]["changes"][0]
+        assert change["action"] == "role"
+        assert change["participant"]["role"] == "interviewer"
+
+        client.delete(f"/api/v1/sessions/{session_id}/participants/{user['id']}")
+        data = websocket.receive_json()
+        assert data["data"]["changes"] == [
+            {"action": "leave", "participant": {"id": user["id"]}}
+        ]
@@ -4,6 +4,7 @@ Tests for WebSocket functionality
 
 import pytest
 from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
 
 
 def test_websocket_connection(client, sample_session_data):
@@ -74,3 +75,126 @@ def test_websocket_user_events(client, sample_session_data):
         data = websocket.receive_json()
         assert data["type"] == "user_join"
         assert data["data"]["user"]["name"] == "New User"
+
+
+def test_websocket_rejects_malformed_messages(client, sample_session_data):
+    """Test that invalid frames get an error reply and are not relayed"""
+    create_response = client.post("/api/v1/sessions", json=sample_session_data)
+    session_id = create_response.json()["data"]["id"]
+
+    with client.websocket_connect(f"/ws/sessions/{session_id}") as websocket:
+        websocket.send_text("not json")
+        data = websocket.receive_json()
+        assert data["type"] == "error"
+        assert data["data"]["code"] == "INVALID_MESSAGE"
+
+        websocket.send_json({"type": "shell_exec", "data": {}})
+        assert websocket.receive_json()["data"]["code"] == "INVALID_MESSAGE"
+
+        websocket.send_json({"type": "language_change", "data": {"language": "cobol"}})
+        assert websocket.receive_json()["data"]["code"] == "INVALID_MESSAGE"
+
+
+def test_websocket_strips_unknown_fields(client, sample_session_data):
+    """Test that only schema fields are relayed"""
+    create_response = client.post("/api/v1/sessions", json=sample_session_data)
+    session_id = create_response.json()["data"]["id"]
+
+    with client.websocket_connect(f"/ws/sessions/{session_id}") as websocket:
+        websocket.send_json(
+            {
+                "type": "user_leave",
+                "data": {"userId": "user1", "payload": "x" * 1000},
+                "extra": True,
+            }
+        )
+        data = websocket.receive_json()
+        assert data["type"] == "user_leave"
+        assert data["data"] == {"userId": "user1"}
+        assert "extra" not in data
+
+
+def test_websocket_closes_on_oversized_message(client, sample_session_data):
+    """Test that frames over the size cap close the connection"""
+    from app.services.message_router import message_router
+
+    create_response = client.post("/api/v1/sessions", json=sample_session_data)
+    session_id = create_response.json()["data"]["id"]
+
+    with client.websocket_connect(f"/ws/sessions/{session_id}") as websocket:
+        websocket.send_json(
+            {
+                "type": "code_change",
+                "data": {"code": "x" * (message_router.max_message_bytes + 1)},
+            }
+        )
+        with pytest.raises(WebSocketDisconnect) as exc_info:
+            websocket.receive_json()
+        assert exc_info.value.code == 1009
+
+
+def test_websocket_rate_limit(client, sample_session_data, monkeypatch):
+    """Test that clients over their token budget are throttled"""
+    from app.services import message_router as router_module
+
+    monkeypatch.setattr(router_module.settings, "WS_RATE_LIMIT_PER_SECOND", 0.0)
+    monkeypatch.setattr(router_module.settings, "WS_RATE_LIMIT_BURST", 2)
+
+    create_response = client.post("/api/v1/sessions", json=sample_session_data)
+    session_id = create_response.json()["data"]["id"]
+
+    with client.websocket_connect(f"/ws/sessions/{session_id}") as websocket:
+        message = {"type": "user_leave", "data": {"userId": "user1"}}
+        for _ in range(2):
+            websocket.send_json(message)
+            assert websocket.receive_json()["type"] == "user_leave"
+
+        websocket.send_json(message)
+        data = websocket.receive_json()
+        assert data["type"] == "error"
+        assert data["data"]["code"] == "RATE_LIMITED"
+
+
+def test_websocket_cursor_positions_are_coalesced(client, sample_session_data):
+    """Test that only the latest cursor per user is relayed"""
+    create_response = client.post("/api/v1/sessions", json=sample_session_data)
+    session_id = create_response.json()["data"]["id"]
+
+    with client.websocket_connect(f"/ws/sessions/{session_id}") as websocket:
+        for column in range(1, 6):
+            websocket.send_json(
+                {
+                    "type": "cursor_position",
+                    "data": {
+                        "position": {"lineNumber": 1, "column": column},
+                        "userId": "user1",
+                    },
+                }
+            )
+        websocket.send_json({"type": "user_leave", "data": {"userId": "marker"}})
+
+        assert websocket.receive_json()["type"] == "user_leave"
+        data = websocket.receive_json()
+        assert data["type"] == "cursor_position"
+        assert data["data"]["position"]["column"] == 5
+
+
+def test_websocket_code_changes_are_persisted(client, sample_session_data):
+    """Test that live edits reach the database once the room empties"""
+    create_response = client.post("/api/v1/sessions", json=sample_session_data)
+    session_id = create_response.json()["data"]["id"]
+
+    with client.websocket_connect(f"/ws/sessions/{session_id}") as websocket:
+        websocket.send_json(
+            {"type": "code_change", "data": {"code": "print('live')", "userId": "u1"}}
+        )
+        websocket.receive_json()
+        websocket.send_json(
+            {"type": "language_change", "data": {"language": "python", "userId": "u1"}}
+        )
+        websocket.receive_json()
+
+    response = client.get(f"/api/v1/sessions/{session_id}")
+    data = response.json()["data"]
+    assert data["code"] == "print('live')"
+    assert data["language"] == "python"
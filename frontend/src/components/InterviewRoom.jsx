@@ -46,6 +46,21 @@ const InterviewRoom = () => {
         setParticipants(prev => prev.filter(p => p.id !== userId));
     };
 
+    // Apply participant changes pushed by the server
+    const handleParticipantsChanged = (changes) => {
+        setParticipants(prev => {
+            const byId = new Map(prev.map(p => [p.id, p]));
+            changes.forEach(({ action, participant }) => {
+                if (action === 'leave') {
+                    byId.delete(participant.id);
+                } else {
+                    byId.set(participant.id, { ...byId.get(participant.id), ...participant });
+                }
+            });
+            return Array.from(byId.values());
+        });
+    };
+
     // Initialize collaboration
     const {
         broadcastCode,
@@ -58,7 +73,8 @@ const InterviewRoom = () => {
         handleRemoteCodeChange,
         handleRemoteLanguageChange,
         handleUserJoin,
-        handleUserLeave
+        handleUserLeave,
+        handleParticipantsChanged
     );
 
     // Join session on mount
@@ -82,7 +98,7 @@ const InterviewRoom = () => {
         }
     }, [currentSession, currentUser, broadcastJoin]);
 
-    // Fetch participants when session is loaded
+    // Fetch participants once when session is loaded; later changes arrive over WebSocket
     useEffect(() => {
         const fetchParticipants = async () => {
             if (currentSession?.id) {
@@ -99,11 +115,6 @@ const InterviewRoom = () => {
         };
 
         fetchParticipants();
-
-        // Poll for participants every 5 seconds to keep the list updated
-        const interval = setInterval(fetchParticipants, 5000);
-
-        return () => clearInterval(interval);
     }, [currentSession?.id]);
 
 
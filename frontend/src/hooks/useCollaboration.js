@@ -6,7 +6,7 @@ import { debounce } from '../utils/helpers.js';
 /**
  * Custom hook for managing real-time collaboration
  */
-export const useCollaboration = (sessionId, currentUserId, onCodeChange, onLanguageChange, onUserJoin, onUserLeave) => {
+export const useCollaboration = (sessionId, currentUserId, onCodeChange, onLanguageChange, onUserJoin, onUserLeave, onParticipantsChanged) => {
     const unsubscribersRef = useRef([]);
 
     // Debounced broadcast functions to avoid excessive updates
@@ -67,12 +67,23 @@ export const useCollaboration = (sessionId, currentUserId, onCodeChange, onLangu
             }
         );
 
+        // Subscribe to participant changes pushed by the server
+        const unsubParticipantsChanged = collaborationService.subscribe(
+            MESSAGE_TYPES.PARTICIPANTS_CHANGED,
+            (data) => {
+                if (onParticipantsChanged) {
+                    onParticipantsChanged(data.changes);
+                }
+            }
+        );
+
         // Store unsubscribers
         unsubscribersRef.current = [
             unsubCodeChange,
             unsubLanguageChange,
             unsubUserJoin,
-            unsubUserLeave
+            unsubUserLeave,
+            unsubParticipantsChanged
         ];
 
         // Cleanup on unmount
@@ -80,7 +91,7 @@ export const useCollaboration = (sessionId, currentUserId, onCodeChange, onLangu
             unsubscribersRef.current.forEach(unsub => unsub());
             collaborationService.cleanup();
         };
-    }, [sessionId, currentUserId, onCodeChange, onLanguageChange, onUserJoin, onUserLeave]);
+    }, [sessionId, currentUserId, onCodeChange, onLanguageChange, onUserJoin, onUserLeave, onParticipantsChanged]);
 
     /**
      * Broadcast code change
@@ -65,6 +65,12 @@ class CollaborationService {
             this.handleMessage(MESSAGE_TYPES.CURSOR_POSITION, message.data);
         });
         this.unsubscribers.push(unsubCursor);
+
+        // Subscribe to server-pushed participant changes
+        const unsubParticipants = websocketService.on('participants_changed', (message) => {
+            this.handleMessage(MESSAGE_TYPES.PARTICIPANTS_CHANGED, message.data);
+        });
+        this.unsubscribers.push(unsubParticipants);
     }
 
     /**
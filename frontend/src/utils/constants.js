@@ -133,7 +133,8 @@ export const MESSAGE_TYPES = {
     LANGUAGE_CHANGE: 'LANGUAGE_CHANGE',
     USER_JOIN: 'USER_JOIN',
     USER_LEAVE: 'USER_LEAVE',
-    CURSOR_POSITION: 'CURSOR_POSITION'
+    CURSOR_POSITION: 'CURSOR_POSITION',
+    PARTICIPANTS_CHANGED: 'PARTICIPANTS_CHANGED'
 };
 
 // User roles